@@ -6,11 +6,16 @@ Cette interface permet de :
 - Voir les métriques du modèle
 """
 
+import asyncio
+
 import streamlit as st
-import requests
+import httpx
 import json
 from typing import Dict, List
 
+# Taille des sous-lots envoyés en parallèle à /predict/batch
+BATCH_CHUNK_SIZE = 25
+
 # Configuration de la page
 st.set_page_config(
     page_title="Spam Detector - G3-MG04",
@@ -22,6 +27,61 @@ st.set_page_config(
 # URL de l'API (par défaut localhost, modifiable dans la sidebar)
 DEFAULT_API_URL = "http://54.75.77.83:8000"
 
+
+@st.cache_resource(show_spinner=False)
+def get_client(base_url: str) -> httpx.Client:
+    """Client HTTP partagé entre les reruns (keep-alive, pool de connexions).
+
+    Évite de repayer l'ouverture TCP/TLS à chaque appel vers l'API.
+    """
+    return httpx.Client(base_url=base_url, timeout=10.0)
+
+
+async def _post_batch_chunks(base_url: str, chunks: List[List[str]]) -> List[Dict]:
+    """Envoie les sous-lots en parallèle pour recouvrir réseau et calcul serveur."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+        responses = await asyncio.gather(
+            *[client.post("/predict/batch", json={"messages": c}) for c in chunks]
+        )
+    for response in responses:
+        response.raise_for_status()
+    return [response.json() for response in responses]
+
+
+def predict_batch_concurrent(base_url: str, messages: List[str]) -> Dict:
+    """Découpe les messages en sous-lots de BATCH_CHUNK_SIZE et agrège les réponses.
+
+    Les sous-lots sont soumis simultanément : l'API peut les répartir sur
+    plusieurs workers au lieu de traiter un seul gros lot séquentiellement.
+    """
+    chunks = [
+        messages[i : i + BATCH_CHUNK_SIZE]
+        for i in range(0, len(messages), BATCH_CHUNK_SIZE)
+    ]
+    partial_results = asyncio.run(_post_batch_chunks(base_url, chunks))
+
+    merged: Dict = {"predictions": [], "total": 0, "spam_count": 0, "ham_count": 0}
+    for part in partial_results:
+        merged["predictions"].extend(part.get("predictions", []))
+        merged["total"] += part.get("total", 0)
+        merged["spam_count"] += part.get("spam_count", 0)
+        merged["ham_count"] += part.get("ham_count", 0)
+    return merged
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def probe_health(url: str) -> tuple:
+    """Interroge /health en cache (TTL 10s) pour éviter un appel réseau à chaque rerun."""
+    response = get_client(url).get("/health", timeout=5)
+    return response.status_code, response.json() if response.is_success else {}
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_metrics(url: str) -> tuple:
+    """Interroge /metrics en cache (TTL 5s)."""
+    response = get_client(url).get("/metrics")
+    return response.status_code, response.json() if response.is_success else {}
+
 # Sidebar - Configuration
 st.sidebar.title("⚙️ Configuration")
 api_url = st.sidebar.text_input(
@@ -35,13 +95,12 @@ st.sidebar.markdown("---")
 st.sidebar.subheader("🔌 État de la connexion")
 
 try:
-    response = requests.get(f"{api_url}/health", timeout=5)
-    if response.status_code == 200:
-        health_data = response.json()
+    status_code, health_data = probe_health(api_url)
+    if status_code == 200:
         st.sidebar.success("✅ API connectée")
         st.sidebar.json(health_data)
     else:
-        st.sidebar.error(f"❌ Erreur : {response.status_code}")
+        st.sidebar.error(f"❌ Erreur : {status_code}")
 except Exception as e:
     st.sidebar.error(f"❌ API non disponible")
     st.sidebar.caption(str(e))
@@ -96,8 +155,8 @@ with tab1:
             else:
                 with st.spinner("Analyse en cours..."):
                     try:
-                        response = requests.post(
-                            f"{api_url}/predict",
+                        response = get_client(api_url).post(
+                            "/predict",
                             json={"message": message},
                             timeout=10
                         )
@@ -185,52 +244,47 @@ Click here to claim your $1000000"""
             else:
                 with st.spinner(f"Analyse de {len(messages)} message(s)..."):
                     try:
-                        response = requests.post(
-                            f"{api_url}/predict/batch",
-                            json={"messages": messages},
-                            timeout=30
-                        )
-
-                        if response.status_code == 200:
-                            result = response.json()
-                            predictions = result.get("predictions", [])
+                        # Sous-lots envoyés en parallèle (voir predict_batch_concurrent)
+                        result = predict_batch_concurrent(api_url, messages)
+                        predictions = result.get("predictions", [])
 
-                            # Statistiques
-                            col1, col2, col3 = st.columns(3)
+                        # Statistiques
+                        col1, col2, col3 = st.columns(3)
 
-                            with col1:
-                                st.metric("📨 Total", result.get("total", 0))
-                            with col2:
-                                st.metric("✅ Ham", result.get("ham_count", 0), delta=None)
-                            with col3:
-                                st.metric("🚨 Spam", result.get("spam_count", 0), delta=None)
+                        with col1:
+                            st.metric("📨 Total", result.get("total", 0))
+                        with col2:
+                            st.metric("✅ Ham", result.get("ham_count", 0), delta=None)
+                        with col3:
+                            st.metric("🚨 Spam", result.get("spam_count", 0), delta=None)
 
-                            st.markdown("---")
+                        st.markdown("---")
 
-                            # Tableau des résultats
-                            st.subheader("📋 Résultats détaillés")
+                        # Tableau des résultats
+                        st.subheader("📋 Résultats détaillés")
 
-                            for i, pred in enumerate(predictions, 1):
-                                msg = pred.get("message", "")
-                                is_spam = pred.get("is_spam", False)
-                                prediction = pred.get("prediction", "")
-                                confidence = pred.get("confidence")
+                        # Les résultats sont positionnels : on retrouve le
+                        # message d'origine par son index
+                        for i, (msg, pred) in enumerate(zip(messages, predictions), 1):
+                            is_spam = pred.get("is_spam", False)
+                            prediction = pred.get("prediction", "")
+                            confidence = pred.get("confidence")
 
-                                if is_spam:
-                                    st.error(f"**{i}.** 🚨 **SPAM** - {msg[:80]}...")
-                                else:
-                                    st.success(f"**{i}.** ✅ **HAM** - {msg[:80]}...")
+                            if is_spam:
+                                st.error(f"**{i}.** 🚨 **SPAM** - {msg[:80]}...")
+                            else:
+                                st.success(f"**{i}.** ✅ **HAM** - {msg[:80]}...")
 
-                                if confidence:
-                                    st.caption(f"Confiance : {confidence:.2%}")
+                            if confidence:
+                                st.caption(f"Confiance : {confidence:.2%}")
 
-                            # JSON complet
-                            with st.expander("📄 Voir la réponse JSON complète"):
-                                st.json(result)
-                        else:
-                            st.error(f"❌ Erreur {response.status_code}")
-                            st.code(response.text)
+                        # JSON complet
+                        with st.expander("📄 Voir la réponse JSON complète"):
+                            st.json(result)
 
+                    except httpx.HTTPStatusError as e:
+                        st.error(f"❌ Erreur {e.response.status_code}")
+                        st.code(e.response.text)
                     except Exception as e:
                         st.error(f"❌ Erreur : {str(e)}")
 
@@ -241,11 +295,12 @@ with tab3:
     st.header("📈 Métriques du Modèle ML")
 
     if st.button("🔄 Actualiser les métriques"):
+        # Force un rafraîchissement en vidant le cache avant l'appel
+        fetch_metrics.clear()
         try:
-            response = requests.get(f"{api_url}/metrics", timeout=10)
+            status_code, data = fetch_metrics(api_url)
 
-            if response.status_code == 200:
-                data = response.json()
+            if status_code == 200:
                 model_metrics = data.get("model_metrics", {})
                 system_metrics = data.get("system_metrics", {})
 
@@ -312,7 +367,7 @@ with tab3:
                 with st.expander("📄 Voir toutes les métriques (JSON)"):
                     st.json(data)
             else:
-                st.error(f"❌ Erreur {response.status_code}")
+                st.error(f"❌ Erreur {status_code}")
 
         except Exception as e:
             st.error(f"❌ Erreur : {str(e)}")
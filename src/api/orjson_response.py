@@ -0,0 +1,22 @@
+"""Custom orjson-backed response class for the API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson.
+
+    OPT_SERIALIZE_NUMPY lets handlers hand NumPy scalars and arrays
+    straight to the encoder without converting them to Python objects
+    first.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -1,8 +1,9 @@
 """Pydantic schemas for request/response validation."""
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PredictRequest(BaseModel):
@@ -15,12 +16,14 @@ class PredictRequest(BaseModel):
         examples=["Get rich quick! Click here now!"],
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "message": "Congratulations! You've won a free iPhone. Click here to claim."
             }
-        }
+        },
+    )
 
 
 class PredictBatchRequest(BaseModel):
@@ -33,8 +36,9 @@ class PredictBatchRequest(BaseModel):
         max_length=100,
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "messages": [
                     "Meeting at 3pm tomorrow",
@@ -42,19 +46,25 @@ class PredictBatchRequest(BaseModel):
                     "Can you send me the report?",
                 ]
             }
-        }
+        },
+    )
 
 
 class PredictionResult(BaseModel):
-    """Schema for a single prediction result."""
+    """Schema for a single prediction result.
+
+    The original message is not echoed back; results are positional,
+    matching the order of the submitted messages.
+    """
 
-    message: str = Field(..., description="Original message")
     prediction: str = Field(..., description="Predicted class: 'spam' or 'ham'")
     is_spam: bool = Field(..., description="True if spam, False if ham")
     confidence: Optional[float] = Field(
         None, description="Confidence score (if available)"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PredictResponse(BaseModel):
     """Response schema for single prediction."""
@@ -64,15 +74,50 @@ class PredictResponse(BaseModel):
     confidence: Optional[float] = Field(None, description="Confidence score")
     message: str = Field(..., description="Original message")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "prediction": "spam",
                 "is_spam": True,
                 "confidence": 0.98,
                 "message": "WIN FREE MONEY NOW!!!",
             }
-        }
+        },
+    )
+
+
+class PredictBatchRequestStruct(msgspec.Struct):
+    """msgspec twin of PredictBatchRequest for the hot batch path.
+
+    Decoding the raw body with msgspec validates the payload (shape,
+    types, size bounds) in a single C pass instead of JSON-parse plus
+    per-field Pydantic validation.
+    """
+
+    messages: Annotated[List[str], msgspec.Meta(min_length=1, max_length=100)]
+
+
+class PredictionResultStruct(msgspec.Struct):
+    """msgspec twin of PredictionResult for the hot batch path.
+
+    Struct construction is a C-level call and msgspec's encoder emits the
+    bytes directly, so the batch handler pays no per-item Pydantic cost.
+    The Pydantic models above remain the OpenAPI source of truth.
+    """
+
+    prediction: str
+    is_spam: bool
+    confidence: Optional[float] = None
+
+
+class PredictBatchResponseStruct(msgspec.Struct):
+    """msgspec twin of PredictBatchResponse, encoded straight to bytes."""
+
+    predictions: List[PredictionResultStruct]
+    total: int
+    spam_count: int
+    ham_count: int
 
 
 class PredictBatchResponse(BaseModel):
@@ -83,18 +128,17 @@ class PredictBatchResponse(BaseModel):
     spam_count: int = Field(..., description="Number of spam messages")
     ham_count: int = Field(..., description="Number of ham messages")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "predictions": [
                     {
-                        "message": "Meeting at 3pm",
                         "prediction": "ham",
                         "is_spam": False,
                         "confidence": 0.95,
                     },
                     {
-                        "message": "WIN FREE MONEY!!!",
                         "prediction": "spam",
                         "is_spam": True,
                         "confidence": 0.99,
@@ -104,7 +148,8 @@ class PredictBatchResponse(BaseModel):
                 "spam_count": 1,
                 "ham_count": 1,
             }
-        }
+        },
+    )
 
 
 class HealthResponse(BaseModel):
@@ -115,15 +160,17 @@ class HealthResponse(BaseModel):
     model_name: Optional[str] = Field(None, description="Name of loaded model")
     version: str = Field(..., description="API version")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "model_loaded": True,
                 "model_name": "linear_svc",
                 "version": "1.0.0",
             }
-        }
+        },
+    )
 
 
 class MetricsResponse(BaseModel):
@@ -132,8 +179,9 @@ class MetricsResponse(BaseModel):
     model_metrics: dict = Field(..., description="ML model performance metrics")
     system_metrics: dict = Field(..., description="System/API metrics")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "model_metrics": {
                     "model": "linear_svc",
@@ -149,7 +197,8 @@ class MetricsResponse(BaseModel):
                     "cache_size": 1,
                 },
             }
-        }
+        },
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -158,10 +207,12 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "error": "Model not loaded",
                 "detail": "Please ensure the model file exists at models/linear_svc.joblib",
             }
-        }
+        },
+    )
@@ -67,7 +67,7 @@ def run_data_pipeline(
         logger.info("\n" + "=" * 80)
         logger.info("STEP 2/3: Cleaning and transforming data")
         logger.info("=" * 80)
-        processed_file = PROJECT_ROOT / "data" / "processed" / "spam_processed.csv"
+        processed_file = PROJECT_ROOT / "data" / "processed" / "spam_processed.parquet"
         df_cleaned = clean_and_transform(
             input_path=raw_file,
             output_path=processed_file,
@@ -9,6 +9,14 @@ from pathlib import Path
 
 import pandas as pd
 
+# Package import first (src.data.__init__ re-exports load_final_data);
+# the bare fallback keeps script mode working, where src/data itself is
+# on sys.path and no package context exists
+try:
+    from .clean_transform import category_counts
+except ImportError:
+    from clean_transform import category_counts
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -17,9 +25,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-DEFAULT_PROCESSED_FILE = PROJECT_ROOT / "data" / "processed" / "spam_processed.csv"
+DEFAULT_PROCESSED_FILE = PROJECT_ROOT / "data" / "processed" / "spam_processed.parquet"
 DEFAULT_FINAL_FILE = PROJECT_ROOT / "data" / "spam.csv"
 
+# Shared S3 client, created on first use. Client construction loads the
+# service model JSON and resolves credentials, which is expensive to
+# repeat; boto3 clients are thread-safe so one instance serves the process.
+_s3_client = None
+
+
+def _get_s3_client():
+    """Return the process-wide S3 client, creating it lazily."""
+    global _s3_client
+    if _s3_client is None:
+        import boto3  # optional dependency, only needed for S3 upload
+
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
 
 def load_final_data(
     input_path: Path | str = DEFAULT_PROCESSED_FILE,
@@ -54,25 +77,26 @@ def load_final_data(
     if not input_path.exists():
         raise FileNotFoundError(f"Processed data not found at {input_path}")
 
-    # Load processed data
-    df = pd.read_csv(input_path)
+    # Load processed data. Parquet hands the strings back Arrow-native
+    # without a parse step, and the column projection skips the metadata
+    # columns entirely. Missing columns fail loudly inside read_parquet,
+    # so no separate schema check is needed.
+    df = pd.read_parquet(
+        input_path,
+        columns=["Message", "Category"],
+        dtype_backend="pyarrow",
+    )
     logger.info(f"Loaded data shape: {df.shape}")
 
-    # Final validation
-    required_columns = {"Message", "Category"}
-    if not required_columns.issubset(df.columns):
-        raise ValueError(
-            f"Missing required columns. Expected {required_columns}, "
-            f"got {set(df.columns)}"
-        )
-
-    # Ensure only necessary columns for training
+    # Ensure only necessary columns for training. Under copy-on-write the
+    # slice is a cheap view; nothing mutates it afterwards, so no copy is
+    # ever materialized.
     final_columns = ["Message", "Category"]
-    df_final = df[final_columns].copy()
+    df_final = df.loc[:, final_columns]
 
     # Log final statistics
     logger.info(f"Final dataset shape: {df_final.shape}")
-    logger.info(f"Category distribution:\n{df_final['Category'].value_counts()}")
+    logger.info(f"Category distribution: {category_counts(df_final['Category'])}")
 
     # Save locally
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -85,10 +109,25 @@ def load_final_data(
             raise ValueError("s3_bucket and s3_key are required when save_to_s3=True")
 
         try:
-            import boto3
-
-            s3_client = boto3.client("s3")
-            s3_client.upload_file(str(output_path), s3_bucket, s3_key)
+            from boto3.s3.transfer import TransferConfig
+
+            s3_client = _get_s3_client()
+            # Multipart with threaded part uploads: overlaps network RTTs
+            # instead of streaming the file sequentially once it grows
+            # past the 8 MiB threshold
+            transfer_config = TransferConfig(
+                multipart_threshold=8 << 20,
+                multipart_chunksize=8 << 20,
+                max_concurrency=10,
+                use_threads=True,
+            )
+            s3_client.upload_file(
+                str(output_path),
+                s3_bucket,
+                s3_key,
+                Config=transfer_config,
+                ExtraArgs={"ContentType": "text/csv"},
+            )
             logger.info(f"✓ Uploaded to s3://{s3_bucket}/{s3_key}")
         except ImportError:
             logger.error("boto3 is required for S3 upload. Install with: pip install boto3")
@@ -10,8 +10,8 @@ from .config import (
 )
 from .data import load_dataset, train_test_split_data
 from .evaluation import evaluate_model
-from .modeling import AVAILABLE_MODELS, get_model_pipeline
-from .preprocessing import clean_text
+from .modeling import AVAILABLE_MODELS, get_model_pipeline, save_model
+from .preprocessing import clean_text, clean_text_batch
 
 __all__ = [
     "DEFAULT_DATA_PATH",
@@ -21,9 +21,11 @@ __all__ = [
     "TEST_SIZE",
     "TFIDF_PARAMS",
     "clean_text",
+    "clean_text_batch",
     "evaluate_model",
     "get_model_pipeline",
     "load_dataset",
+    "save_model",
     "train_test_split_data",
     "AVAILABLE_MODELS",
 ]
@@ -5,22 +5,8 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 import numpy as np
-from sklearn.metrics import (
-    accuracy_score,
-    confusion_matrix,
-    precision_recall_fscore_support,
-    roc_auc_score,
-)
-
-
-def _compute_auc(model, X_test, y_test) -> Optional[float]:
-    if hasattr(model, "decision_function"):
-        scores = model.decision_function(X_test)
-        return float(roc_auc_score(y_test, scores))
-    if hasattr(model, "predict_proba"):
-        proba = model.predict_proba(X_test)[:, 1]
-        return float(roc_auc_score(y_test, proba))
-    return None
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import Pipeline
 
 
 def evaluate_model(
@@ -31,18 +17,52 @@ def evaluate_model(
     y_test,
     model_name: str,
 ) -> Dict[str, Any]:
-    """Fit model (if not already fitted) and compute metrics."""
+    """Fit model (if not already fitted) and compute metrics.
+
+    The test set runs through the feature stages and the classifier's
+    scoring function exactly once: for a Pipeline the preprocessing is
+    applied separately, and the binary predictions are derived from the
+    same decision scores / probabilities used for the AUC instead of a
+    second predict() pass.
+    """
     if not hasattr(model, "classes_"):
         model.fit(X_train, y_train)
 
-    preds = model.predict(X_test)
-    auc = _compute_auc(model, X_test, y_test)
+    if isinstance(model, Pipeline) and len(model.steps) > 1:
+        X_test_features = model[:-1].transform(X_test)
+        clf = model[-1]
+    else:
+        X_test_features = X_test
+        clf = model
+
+    auc: Optional[float] = None
+    if hasattr(clf, "decision_function"):
+        scores = clf.decision_function(X_test_features)
+        # classes_ are (0, 1) here, so the margin sign is the prediction
+        preds = (scores > 0).astype(int)
+        auc = float(roc_auc_score(y_test, scores))
+    elif hasattr(clf, "predict_proba"):
+        proba = clf.predict_proba(X_test_features)[:, 1]
+        preds = (proba >= 0.5).astype(int)
+        auc = float(roc_auc_score(y_test, proba))
+    else:
+        preds = clf.predict(X_test_features)
+
+    # All the binary metrics derive from the four confusion-matrix cells,
+    # so count them in one bincount pass over the label arrays instead of
+    # separate accuracy_score / precision_recall_fscore_support /
+    # confusion_matrix calls, each of which revalidates and rescans both
+    # arrays. Encoding: 2 * truth + prediction maps (tn, fp, fn, tp) to
+    # bins (0, 1, 2, 3).
+    y_test = np.asarray(y_test)
+    counts = np.bincount(2 * y_test.astype(np.intp) + preds, minlength=4)
+    tn, fp, fn, tp = (int(c) for c in counts)
 
-    acc = accuracy_score(y_test, preds)
-    prec, rec, f1, _ = precision_recall_fscore_support(
-        y_test, preds, average="binary", zero_division=0
-    )
-    cm = confusion_matrix(y_test, preds)
+    acc = (tp + tn) / counts.sum()
+    # Zero denominators yield 0.0, matching sklearn's zero_division=0
+    prec = tp / (tp + fp) if tp + fp else 0.0
+    rec = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * prec * rec / (prec + rec) if prec + rec else 0.0
 
     return {
         "model": model_name,
@@ -51,5 +71,5 @@ def evaluate_model(
         "recall": float(rec),
         "f1": float(f1),
         "roc_auc": auc,
-        "confusion_matrix": cm.tolist(),
+        "confusion_matrix": [[tn, fp], [fn, tp]],
     }
@@ -2,75 +2,217 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.feature_extraction.text import (
+    HashingVectorizer,
+    TfidfTransformer,
+    TfidfVectorizer,
+)
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
 from sklearn.svm import LinearSVC
 
 from .config import MODEL_PARAMS, RANDOM_STATE, TFIDF_PARAMS
-from .preprocessing import TextCleaner
+from .preprocessing import clean_corpus_vectorized
 
 AVAILABLE_MODELS = ("linear_svc", "multinomial_nb", "log_reg")
 
 
-def _build_tfidf_vectorizer() -> TfidfVectorizer:
-    return TfidfVectorizer(**TFIDF_PARAMS)
-
+class _InplaceTfidfTransformer(TfidfTransformer):
+    """TfidfTransformer that weights the input matrix in place.
+
+    sklearn already applies IDF without the old sparse-diagonal matmul
+    (X.data *= idf_[X.indices], in place since scikit-learn#18843); the
+    remaining allocation in transform is the defensive copy of the input
+    CSR matrix taken under the copy=True default. Inside the hashing
+    sub-pipeline the input is always a fresh temporary from the
+    HashingVectorizer, so defaulting to copy=False drops one allocation
+    the size of the count matrix per transform call.
+    """
+
+    def transform(self, X, copy=False):
+        return super().transform(X, copy=copy)
+
+
+def _build_tfidf_vectorizer():
+    """Build the TF-IDF stage from TFIDF_PARAMS.
+
+    Returns a TfidfVectorizer by default. With use_hashing=True in
+    TFIDF_PARAMS it instead returns a HashingVectorizer + TfidfTransformer
+    sub-pipeline: hashing needs no vocabulary dict (token -> column is a
+    C-level murmurhash instead of a Python dict lookup) and fits in a
+    single pass, roughly halving fit memory on large corpora at the cost
+    of a fixed feature width and no inverse vocabulary for inspection.
+    """
+    params: Dict = dict(TFIDF_PARAMS)
+    if params.pop("use_hashing", False):
+        return Pipeline(
+            [
+                (
+                    "hashing",
+                    HashingVectorizer(
+                        n_features=2**18,
+                        # Unsigned counts so the TF-IDF weighting downstream
+                        # sees ordinary term frequencies
+                        alternate_sign=False,
+                        # Normalization belongs to the TF-IDF step
+                        norm=None,
+                        ngram_range=params.get("ngram_range", (1, 1)),
+                        dtype=params.get("dtype", np.float32),
+                        lowercase=params.get("lowercase", False),
+                        token_pattern=params.get(
+                            "token_pattern", r"(?u)\b\w\w+\b"
+                        ),
+                    ),
+                ),
+                (
+                    "tfidf",
+                    _InplaceTfidfTransformer(
+                        sublinear_tf=params.get("sublinear_tf", False),
+                        smooth_idf=params.get("smooth_idf", True),
+                    ),
+                ),
+            ]
+        )
+    # Keep the sparse matrix at float32 even if TFIDF_PARAMS is edited
+    # without a dtype: the linear solvers are bandwidth-bound on the CSR
+    # data and none of them needs float64 precision here
+    params.setdefault("dtype", np.float32)
+    # The clean step ahead of the vectorizer already lower-cased the
+    # text, so skip sklearn's own lowercase pass — one full scan per
+    # document at fit and at transform
+    params.setdefault("lowercase", False)
+    # sklearn's default, stated explicitly. The regex tokenizer stays:
+    # swapping in str.split would change tokenization (single-letter and
+    # apostrophe handling) and therefore the vocabulary.
+    params.setdefault("token_pattern", r"(?u)\b\w\w+\b")
+    return TfidfVectorizer(**params)
+
+
+def _clean_step() -> FunctionTransformer:
+    # A stateless FunctionTransformer skips the estimator parameter
+    # validation and clone bookkeeping the TextCleaner class paid on
+    # every fit/clone; TextCleaner itself remains for unpickling older
+    # artifacts
+    return FunctionTransformer(clean_corpus_vectorized, validate=False)
+
+
+def _validate_model_name(model_name: str) -> str:
+    normalized = model_name.lower()
+    if normalized not in AVAILABLE_MODELS:
+        raise ValueError(f"Unsupported model '{model_name}'. Choose from {AVAILABLE_MODELS}")
+    return normalized
 
-def _clean_step() -> TextCleaner:
-    return TextCleaner()
 
+@lru_cache(maxsize=None)
+def _prototype(normalized: str):
+    """Build the classifier for a model name once; get_classifier clones it.
 
-def _linear_svc_pipeline() -> Pipeline:
-    params: Dict = MODEL_PARAMS["linear_svc"]
-    return Pipeline(
-        [
-            ("clean", _clean_step()),
-            ("tfidf", _build_tfidf_vectorizer()),
-            ("clf", LinearSVC(random_state=RANDOM_STATE, **params)),
-        ]
-    )
-
-
-def _multinomial_nb_pipeline() -> Pipeline:
-    params: Dict = MODEL_PARAMS["multinomial_nb"]
-    return Pipeline(
+    Resolving MODEL_PARAMS (dict copy, key pops, kwarg unpacking,
+    estimator __init__ validation) happens on the first request per
+    model; every later call is a clone of the cached instance. The cache
+    therefore snapshots MODEL_PARAMS as of first use — call
+    _prototype.cache_clear() after editing the config at runtime.
+    """
+    if normalized == "linear_svc":
+        params: Dict = dict(MODEL_PARAMS["linear_svc"])
+        if params.pop("solver", None) == "sgd":
+            # Opt-in stochastic solver: hinge-loss SGD optimizes the
+            # same linear-SVM objective and trains markedly faster on
+            # large corpora. Regularization is controlled via alpha, so
+            # the liblinear C parameter is not forwarded.
+            params.pop("C", None)
+            return SGDClassifier(loss="hinge", random_state=RANDOM_STATE, **params)
+        return LinearSVC(random_state=RANDOM_STATE, **params)
+    if normalized == "multinomial_nb":
+        return MultinomialNB(**MODEL_PARAMS["multinomial_nb"])
+
+    params: Dict = dict(MODEL_PARAMS["log_reg"])
+    # Use all cores when the solver can: liblinear is single-threaded
+    # (sklearn warns if n_jobs is set with it), the other solvers
+    # parallelize across cores
+    if params.get("solver", "lbfgs") != "liblinear":
+        params.setdefault("n_jobs", -1)
+    return LogisticRegression(random_state=RANDOM_STATE, **params)
+
+
+def get_classifier(model_name: str):
+    """Return an unfitted bare classifier matching the requested model.
+
+    Used directly when features are prepared separately (see
+    build_shared_features); get_model_pipeline wraps the same classifier
+    behind the clean + TF-IDF stages. Each call returns a fresh clone of
+    a cached prototype, so callers can fit the result without affecting
+    one another.
+    """
+    return clone(_prototype(_validate_model_name(model_name)))
+
+
+def build_shared_features(X_train, X_test, pre_cleaned: bool = False):
+    """Fit the clean + TF-IDF stages once and transform both splits.
+
+    Model comparison trains several classifiers on identical features;
+    fitting the preprocessing a single time removes the redundant
+    cleaning and TF-IDF passes per model. Returns the transformed
+    train/test matrices and the feature pipeline, whose steps can be
+    reused to assemble full text-in pipelines for persistence.
+
+    With pre_cleaned=True the inputs are assumed to already be cleaned
+    text (e.g. from clean_corpus_cached) and only the TF-IDF stage runs;
+    the returned pipeline still contains the stateless clean step so it
+    keeps accepting raw text.
+    """
+    features = Pipeline(
         [
             ("clean", _clean_step()),
             ("tfidf", _build_tfidf_vectorizer()),
-            ("clf", MultinomialNB(**params)),
         ]
     )
+    if pre_cleaned:
+        tfidf = features.named_steps["tfidf"]
+        X_train_features = tfidf.fit_transform(X_train)
+        X_test_features = tfidf.transform(X_test)
+    else:
+        X_train_features = features.fit_transform(X_train)
+        X_test_features = features.transform(X_test)
+    return X_train_features, X_test_features, features
+
+
+def save_model(model, path: Path | str) -> None:
+    """Persist a fitted model with compression.
+
+    Pickle protocol 5 serializes the NumPy payloads as out-of-band
+    buffers, and compression shrinks the vocabulary-heavy artifacts
+    severalfold. LZ4 is preferred for its near-free decompression, with
+    a zlib fallback when the optional lz4 package is not installed.
+    Compressed dumps cannot be memory-mapped at load time; the API's
+    model_loader detects this and loads them into the heap (lz4
+    decompression is near-free), reserving mmap sharing for artifacts
+    dumped uncompressed. Pass the model through joblib.dump directly if
+    page-cache sharing across many worker processes matters more than
+    artifact size.
+    """
+    try:
+        joblib.dump(model, path, compress=("lz4", 3), protocol=5)
+    except ValueError:
+        joblib.dump(model, path, compress=3, protocol=5)
 
 
-def _log_reg_pipeline() -> Pipeline:
-    params: Dict = MODEL_PARAMS["log_reg"]
+def get_model_pipeline(model_name: str) -> Pipeline:
+    """Return a pipeline matching the requested model."""
+    normalized = _validate_model_name(model_name)
     return Pipeline(
         [
             ("clean", _clean_step()),
             ("tfidf", _build_tfidf_vectorizer()),
-            (
-                "clf",
-                LogisticRegression(
-                    random_state=RANDOM_STATE,
-                    **params,
-                ),
-            ),
+            ("clf", get_classifier(normalized)),
         ]
     )
-
-
-def get_model_pipeline(model_name: str) -> Pipeline:
-    """Return a pipeline matching the requested model."""
-    normalized = model_name.lower()
-    if normalized not in AVAILABLE_MODELS:
-        raise ValueError(f"Unsupported model '{model_name}'. Choose from {AVAILABLE_MODELS}")
-
-    if normalized == "linear_svc":
-        return _linear_svc_pipeline()
-    if normalized == "multinomial_nb":
-        return _multinomial_nb_pipeline()
-    return _log_reg_pipeline()
@@ -7,8 +7,11 @@ set -e
 API_PORT=${PORT:-8000}
 STREAMLIT_PORT=${STREAMLIT_PORT:-8501}
 
-echo "Starting Spam Detector API on port ${API_PORT}..."
-uvicorn src.api.main:app --host 0.0.0.0 --port ${API_PORT} &
+API_WORKERS=${API_WORKERS:-$(nproc 2>/dev/null || echo 1)}
+
+echo "Starting Spam Detector API on port ${API_PORT} with ${API_WORKERS} worker(s)..."
+uvicorn src.api.main:app --host 0.0.0.0 --port ${API_PORT} \
+    --workers "${API_WORKERS}" --loop uvloop --http httptools &
 API_PID=$!
 
 cleanup() {